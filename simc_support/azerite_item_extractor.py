@@ -43,7 +43,7 @@ def load_azerite_items() -> dict:
 
   for item in items:
     if "azeritePowerSetId" in item:
-      logger.debug("{} found. Adding.".format(item['name']))
+      logger.debug("%s found. Adding.", item['name'])
 
       try:
         sorted_items[item_type[item["inventoryType"]]].append(item)
@@ -102,7 +102,7 @@ def main():
   # logger.info(enriched_azerite_items_list)
 
   with open('azerite_items.json', 'w', encoding='utf-8') as f:
-    json.dump(enriched_azerite_items_list, f, indent=2, ensure_ascii=False)
+    f.write(json.dumps(enriched_azerite_items_list, indent=2, ensure_ascii=False))
 
 
 
@@ -4,7 +4,9 @@
 
 import json
 import logging
+import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from . import wow_lib
 
 logger = logging.getLogger(__name__)
@@ -61,9 +63,8 @@ def update_map(trait_dict):
 
                 else:
                     logger.debug(
-                        "Trait {} (id={}) was already found in MAP. Only name and description will be updated.".format(
-                            trait_dict[wow_class][wow_spec][trait_id]["name"], trait_id
-                        )
+                        "Trait %s (id=%s) was already found in MAP. Only name and description will be updated.",
+                        trait_dict[wow_class][wow_spec][trait_id]["name"], trait_id
                     )
                     updated_map[trait_id]["name"] = trait_dict[wow_class][wow_spec][trait_id]["name"]
                     updated_map[trait_id]["trait_id"] = trait_dict[wow_class][wow_spec][trait_id]["trait_id"]
@@ -173,6 +174,31 @@ def update_list(trait_dict):
         f.write(json.dumps(trait_classes, sort_keys=True, indent=4))
 
 
+def run_spell_query(wow_class: str, ptr_input: str):
+    """Run the azerite spell_query of simc for one wow class.
+
+    Arguments:
+        wow_class {str} -- wow class name as returned by wow_lib.get_classes()
+        ptr_input {str} -- simc ptr option
+
+    Returns:
+        CompletedProcess -- finished simc run
+    """
+
+    cleaned_wow_class = wow_class.lower().replace("_", "")
+    commands = [
+        "../SimulationCraft/engine/simc",
+        f"spell_query=azerite.class={cleaned_wow_class}",
+        ptr_input
+    ]
+    return subprocess.run(
+        commands,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        universal_newlines=True
+    )
+
+
 def main():
     logger.info("Started")
 
@@ -191,20 +217,16 @@ def main():
     else:
         ptr_input = "ptr=0"
 
+    # simc runs are independent but cpu bound, run as many at once as there are cores
+    # results are parsed in class order afterwards
+    with ThreadPoolExecutor(max_workers=min(len(class_list), os.cpu_count() or 1)) as executor:
+        futures = {
+            wow_class: executor.submit(run_spell_query, wow_class, ptr_input) for wow_class in class_list
+        }
+
     for wow_class in class_list:
         try:
-            cleaned_wow_class = wow_class.lower().replace("_", "")
-            commands = [
-                "../SimulationCraft/engine/simc",
-                f"spell_query=azerite.class={cleaned_wow_class}",
-                ptr_input
-            ]
-            simc_output = subprocess.run(
-                commands,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                universal_newlines=True
-            )
+            simc_output = futures[wow_class].result()
         except Exception as e:
             logger.info("{} failed to load. {}".format(wow_class, e))
             continue
@@ -1,6 +1,8 @@
 """File contains an interface to get wow data.
 """
 
+import copy
+import functools
 import json
 
 from .game_data import Source
@@ -15,6 +17,30 @@ from .game_data.Trinket import Trinket
 from .game_data.Trinket import trinket_list as __trinket_list
 from .game_data.WowClass import class_data as __class_data
 
+# blacklisted corruption names per class and spec, built once for O(1) membership checks
+_corruption_blacklist_sets = {
+    wow_class: {wow_spec: frozenset(names) for wow_spec, names in specs.items()}
+    for wow_class, specs in corruption_blacklist.items()
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _load_json(file_name: str):
+    """Load a json data file shipped with this package. Files are read only once per process.
+    The result is shared between calls, public getters must return copies of it.
+
+    Arguments:
+        file_name {str} -- name of the file inside the package
+
+    Returns:
+        dict or list -- parsed file content
+    """
+
+    import pkg_resources
+
+    with open(pkg_resources.resource_filename(__name__, file_name), 'r', encoding="UTF-8") as f:
+        return json.load(f)
+
 
 def is_melee(wow_class, wow_spec):
     """True if spec is melee spec.
@@ -66,39 +92,24 @@ def get_mask_for_spec(wow_class, wow_spec):
 
 
 def _compare_trinket_lists():
-    import pkg_resources
-
-    path = "equippable-items.json"
-
-    with open(pkg_resources.resource_filename(__name__, path), 'r', encoding="UTF-8") as f:
-
-        loaded_items = json.load(f, encoding="UTF-8")
+    loaded_items = _load_json("equippable-items.json")
 
     # compare from wow data to local list
     print("Searching through equippable-items.json:")
     missing = 0
+    trinket_names = {trinket.get_name() for trinket in __trinket_list}
     for item in loaded_items:
         if item["inventoryType"] == 12 and item["itemLevel"] >= 280:
-            found = False
-            for trinket in __trinket_list:
-                if trinket.get_name() == item["name"]:
-                    found = True
-
-            if not found:
+            if item["name"] not in trinket_names:
                 missing += 1
                 print(f"  {item['name']} not found in local list! id: {item['id']}")
     if missing:
         print(f"{missing} trinkets are missing.\n")
 
     print("Searching through local trinkets:")
+    item_ids = {int(item["id"]) for item in loaded_items}
     for trinket in __trinket_list:
-        found = False
-
-        for item in loaded_items:
-            if int(trinket.get_id()) == int(item["id"]):
-                found = True
-
-        if not found:
+        if int(trinket.get_id()) not in item_ids:
             print(f"  {trinket.get_name()} not found in equippable-items.json! id: {trinket.get_id()}")
 
 
@@ -116,27 +127,9 @@ def get_trinkets_for_spec(wow_class: str, wow_spec: str) -> list:
     agility, intellect, strength, melee, ranged = get_mask_for_spec(wow_class, wow_spec)
     return_list = []
     for trinket in __trinket_list:
-        if melee and trinket.melee:
-            return_list.append((
-                trinket.name, trinket.item_id, trinket.min_itemlevel, trinket.max_itemlevel,
-                trinket.max_itemlevel_drop, trinket.active
-            ))
-        elif ranged and trinket.ranged:
-            return_list.append((
-                trinket.name, trinket.item_id, trinket.min_itemlevel, trinket.max_itemlevel,
-                trinket.max_itemlevel_drop, trinket.active
-            ))
-        elif agility and trinket.agility:
-            return_list.append((
-                trinket.name, trinket.item_id, trinket.min_itemlevel, trinket.max_itemlevel,
-                trinket.max_itemlevel_drop, trinket.active
-            ))
-        elif intellect and trinket.intellect:
-            return_list.append((
-                trinket.name, trinket.item_id, trinket.min_itemlevel, trinket.max_itemlevel,
-                trinket.max_itemlevel_drop, trinket.active
-            ))
-        elif strength and trinket.strength:
+        if (melee and trinket.melee) or (ranged and trinket.ranged) or (agility and trinket.agility) or (
+            intellect and trinket.intellect
+        ) or (strength and trinket.strength):
             return_list.append((
                 trinket.name, trinket.item_id, trinket.min_itemlevel, trinket.max_itemlevel,
                 trinket.max_itemlevel_drop, trinket.active
@@ -167,19 +160,13 @@ def get_trinket_list() -> list:
         list -- item list
     """
 
-    import pkg_resources
-
-    path = "equippable-items.json"
-
-    with open(pkg_resources.resource_filename(__name__, path), 'r', encoding="UTF-8") as f:
-
-        loaded_items = json.load(f, encoding="UTF-8")
+    loaded_items = _load_json("equippable-items.json")
 
     item_list: list = []
 
     for item in loaded_items:
         if item["inventoryType"] == 12 and item["itemLevel"] >= 280:
-            item_list.append(item)
+            item_list.append(copy.deepcopy(item))
 
     return item_list
 
@@ -194,16 +181,10 @@ def get_trinket_translation(trinket_name) -> dict:
         dict -- [description]
     """
 
-    import pkg_resources
-
-    path = "trinket_translations.json"
-
-    with open(pkg_resources.resource_filename(__name__, path), 'r', encoding="UTF-8") as f:
-
-        loaded_items = json.load(f, encoding="UTF-8")
+    loaded_items = _load_json("trinket_translations.json")
 
     try:
-        return loaded_items[trinket_name]
+        return dict(loaded_items[trinket_name])
     except Exception as e:
         raise LookupError("Translation not found for {}. {}".format(trinket_name, e))
 
@@ -234,16 +215,10 @@ def get_azerite_item_translation(item_name) -> dict:
         dict -- [description]
     """
 
-    import pkg_resources
-
-    path = "azerite_item_translations.json"
-
-    with open(pkg_resources.resource_filename(__name__, path), 'r', encoding="UTF-8") as f:
-
-        loaded_items = json.load(f, encoding="UTF-8")
+    loaded_items = _load_json("azerite_item_translations.json")
 
     try:
-        return loaded_items[item_name]
+        return dict(loaded_items[item_name])
     except Exception as e:
         raise LookupError("Translation not found for {}. {}".format(item_name, e))
 
@@ -267,19 +242,13 @@ def get_item_translation(item_name: str = "", item_id: int = None, item_list: li
         loaded_items = item_list
 
     else:
-        import pkg_resources
-
-        path = "equippable-items.json"
-
-        with open(pkg_resources.resource_filename(__name__, path), 'r', encoding="UTF-8") as f:
-
-            loaded_items = json.load(f, encoding="UTF-8")
+        loaded_items = _load_json("equippable-items.json")
 
     for item in loaded_items:
         if item_name and item_name == item["name"]:
-            return item["names"]
+            return dict(item["names"])
         elif item_id and int(item_id) == item["id"]:
-            return item["names"]
+            return dict(item["names"])
 
     raise LookupError("Translation not found for {}{}".format(item_name, item_id))
 
@@ -291,15 +260,10 @@ def get_trait_translation_dict():
         dict -- {Name:{language:translation}}
     """
 
-    import pkg_resources
-
-    path = "azerite_trait_translations.json"
+    loaded_translations = _load_json("azerite_trait_translations.json")
 
-    with open(pkg_resources.resource_filename(__name__, path), 'r', encoding="UTF-8") as f:
-
-        loaded_translations = json.load(f, encoding="UTF-8")
-
-    return loaded_translations
+    # copy both levels so callers can't modify the cached data
+    return {name: dict(translations) for name, translations in loaded_translations.items()}
 
 
 def get_trait_translation(trait_name: str = "", translation_dict: dict = None) -> dict:
@@ -319,21 +283,15 @@ def get_trait_translation(trait_name: str = "", translation_dict: dict = None) -
     if translation_dict:
         loaded_translations = translation_dict
     else:
-        import pkg_resources
-
-        path = "azerite_trait_translations.json"
-
-        with open(pkg_resources.resource_filename(__name__, path), 'r', encoding="UTF-8") as f:
-
-            loaded_translations = json.load(f, encoding="UTF-8")
+        loaded_translations = _load_json("azerite_trait_translations.json")
 
     try:
-        return loaded_translations[trait_name]
+        return dict(loaded_translations[trait_name])
     except Exception:
         for name in loaded_translations:
             if name in trait_name:
                 try:
-                    return loaded_translations[name]
+                    return dict(loaded_translations[name])
                 except Exception:
                     raise LookupError("Translation not found for {}".format(trait_name))
 
@@ -409,15 +367,10 @@ def get_azerite_traits(wow_class: str, wow_spec: str) -> dict:
         dict -- Dict{spell_id: str : Dict{description: str : str, max_itemlevel: str : int, max_stack: str : int, min_itemlevel: str : int, name: str : str, spell_id: str : str, trait_id: str : str}}
     """
 
-    import pkg_resources
-
-    path = "azerite_trait_list.json"
-
-    with open(pkg_resources.resource_filename(__name__, path), 'r', encoding="UTF-8") as f:
-        traits = json.load(f, encoding="UTF-8")
+    traits = _load_json("azerite_trait_list.json")
 
     try:
-        return traits[wow_class.title()][wow_spec.title()]
+        return copy.deepcopy(traits[wow_class.title()][wow_spec.title()])
     except Exception as e:
         raise e
 
@@ -441,13 +394,7 @@ def get_azerite_items(wow_class: str, wow_spec: str) -> dict:
       dictionary -- all available azerite items for the given spec
     """
 
-    import pkg_resources
-
-    path = "equippable-items.json"
-
-    with open(pkg_resources.resource_filename(__name__, path), 'r', encoding="UTF-8") as f:
-
-        loaded_items = json.load(f, encoding="UTF-8")
+    loaded_items = _load_json("equippable-items.json")
 
     items: dict = {"head": [], "shoulders": [], "chest": []}
     item_type = {
@@ -465,25 +412,8 @@ def get_azerite_items(wow_class: str, wow_spec: str) -> dict:
             except Exception:
                 pass
 
-    # enrich dict with azerite traits
-    path = "azerite-power-sets.json"
-
-    with open(pkg_resources.resource_filename(__name__, path), 'r', encoding="UTF-8") as f:
-        azerite_traits = json.load(f, encoding="UTF-8")
-
-    for slot in items:
-        for i in range(len(items[slot])):
-            item = items[slot][i]
-            try:
-                items[slot][i]["azeriteTraits"] = azerite_traits[str(items[slot][i]["azeritePowerSetId"])]
-            except Exception:     # as e:
-                # logger.error(e)
-                # logger.error("slot: {}".format(slot))
-                # logger.error("item: {}".format(item))
-                # logger.error("item data: {}".format(items[slot][i]))
-                # logger.error("azeritePowerSetId: {}".format(items[slot][i]["azeritePowerSetId"]))
-                # logger.error(trait_dict[str(items[slot][i]["azeritePowerSetId"])])
-                pass
+    # azerite traits of each item, looked up by its azeritePowerSetId
+    azerite_traits = _load_json("azerite-power-sets.json")
 
     # create a new itemlist with only items for the wow spec/class
     response: dict = {}
@@ -498,15 +428,16 @@ def get_azerite_items(wow_class: str, wow_spec: str) -> dict:
         for item in items[slot]:
             new_trait_list = []
 
-            for trait in item["azeriteTraits"]:
+            for trait in azerite_traits[str(item["azeritePowerSetId"])]:
                 if trait["classId"] == class_id and (trait["specUsable"] == [] or spec_id in trait["specUsable"]):
                     new_trait_list.append(trait)
 
-            item["azeriteTraits"] = new_trait_list
-
-            if item["azeriteTraits"]:
+            if new_trait_list:
                 # add item only to the response if it has traits for the givesn class/spec
-                response[slot].append(item)
+                # copy only now, the loaded data is shared between calls
+                new_item = dict(item)
+                new_item["azeriteTraits"] = [dict(trait) for trait in new_trait_list]
+                response[slot].append(new_item)
 
     return response
 
@@ -566,16 +497,13 @@ def get_talent_dict(wow_class: str, wow_spec: str, ptr: bool = False) -> dict:
     Returns:
         dict -- row -> column -> name, spell_id
     """
-    import pkg_resources
-
     file_name = "talent_list.json"
     if ptr:
         file_name = "talent_list_ptr.json"
 
-    with open(pkg_resources.resource_filename(__name__, file_name), 'r', encoding="UTF-8") as f:
-        talents = json.load(f, encoding="UTF-8")
+    talents = _load_json(file_name)
 
-    return talents[wow_class.title()][wow_spec.title()]
+    return copy.deepcopy(talents[wow_class.title()][wow_spec.title()])
 
 
 def __generate_talent_combinations(blueprint, wow_class, wow_spec):
@@ -994,12 +922,7 @@ def get_essence_power_id(essence_id: int) -> int:
         int -- [description]
     """
 
-    import pkg_resources
-
-    file_name = "azerite-essence-power-spell-map.json"
-
-    with open(pkg_resources.resource_filename(__name__, file_name), 'r', encoding="UTF-8") as f:
-        essences = json.load(f, encoding="UTF-8")
+    essences = _load_json("azerite-essence-power-spell-map.json")
 
     return essences[str(essence_id)]["3"]["azeriteEssencePowerId"]
 
@@ -1044,21 +967,12 @@ def get_corruptions(wow_class: str, wow_spec: str) -> dict:
     wow_class = str(wow_class).lower().title()
     wow_spec = str(wow_spec).lower().title()
 
-    # crafting return dictionary by hand...could probably be done by a lib
-    new_dict = {}
+    # filter out blacklisted corruptions for the provided wow_class and wow_spec
+    blacklist = _corruption_blacklist_sets[wow_class][wow_spec]
 
-    for corruption in corruptions:
-
-        # filter out clacklisted corruptions for the provided
-        # wow_class and wow_spec
-        if corruption in corruption_blacklist[wow_class][wow_spec]:
-            continue
-
-        new_dict[corruption] = {}
-
-        for level in corruptions[corruption]:
-            new_dict[corruption][level] = {}
-            for key in corruptions[corruption][level]:
-                new_dict[corruption][level][key] = corruptions[corruption][level][key]
-
-    return new_dict
+    # copy levels so callers can't modify the module data
+    return {
+        corruption: {level: dict(values) for level, values in levels.items()}
+        for corruption, levels in corruptions.items()
+        if corruption not in blacklist
+    }